@@ -1,6 +1,8 @@
 import functools
 import itertools
-from typing import Type, List, Optional, Any, Set, Dict, Union
+import threading
+import numpy as np
+from typing import Type, List, Optional, Any, Set, Dict, Union, Tuple
 from matplotlib.axes import Axes
 from matplotlib.transforms import Bbox
 import matplotlib.docstring as docstring
@@ -12,6 +14,35 @@ from dataclasses import dataclass
 DEFAULT_RENDER_DEPTH = 5
 
 
+class _DrawState(threading.local):
+    """
+    PRIVATE: Thread local drawing state, holding a dictionary of figure ids
+    to the number of view draws currently in progress for that figure.
+    """
+    def __init__(self):
+        self.depths: Dict[int, int] = {}
+
+
+# The current render depth of each figure being drawn. It is tracked per
+# figure, so the number of recursive draws is even in the case of multiple
+# axes drawing each other in the same figure, and per thread, so figures
+# drawn in different threads don't share a count.
+_DRAW_STATE = _DrawState()
+
+
+def _sorted_extents(bbox: Bbox) -> Tuple[float, float, float, float]:
+    """
+    PRIVATE: Get the extents of a bbox, with each pair of coordinates swapped
+    if needed so the minimums come first. NaN values are left in place.
+    """
+    x0, y0, x1, y1 = bbox.extents
+    if(x0 > x1):
+        x0, x1 = x1, x0
+    if(y0 > y1):
+        y0, y1 = y1, y0
+    return x0, y0, x1, y1
+
+
 class _BoundRendererArtist:
     """
     Provides a temporary wrapper around a given artist, inheriting its
@@ -19,56 +50,122 @@ class _BoundRendererArtist:
     TransformRenderer. This is used to render an artist to a view without
     having to implement a new draw method for every Axes type.
     """
+    __slots__ = (
+        "_artist",
+        "_renderer",
+        "_clip_box",
+        "_clip_extents",
+        "_draw",
+        "_get_window_extent",
+        "_get_clip_box",
+        "_set_clip_box",
+        "_get_clip_path",
+        "_set_clip_path"
+    )
+
     def __init__(
         self,
         artist: Artist,
         renderer: _TransformRenderer,
         clip_box: Bbox
     ):
+        self._set_artist(artist)
+        # The clip box doesn't change while drawing, so store its (sorted)
+        # extents once for the intersection test in draw.
+        self._retarget(renderer, clip_box, _sorted_extents(clip_box))
+
+    def _set_artist(self, artist: Artist):
+        """
+        PRIVATE: Set the artist this wrapper draws, allowing the wrapper to
+        be recycled for a different artist.
+        """
         self._artist = artist
+        # Bind the methods used while drawing up front, so draw doesn't
+        # have to look them up on the artist every time it is called.
+        self._draw = artist.draw
+        self._get_window_extent = artist.get_window_extent
+        self._get_clip_box = artist.get_clip_box
+        self._set_clip_box = artist.set_clip_box
+        self._get_clip_path = artist.get_clip_path
+        self._set_clip_path = artist.set_clip_path
+
+    def _retarget(
+        self,
+        renderer: _TransformRenderer,
+        clip_box: Bbox,
+        clip_extents: Tuple[float, float, float, float]
+    ):
+        """
+        PRIVATE: Point this wrapper at a new renderer and clip box, allowing
+        it to be reused across draws. clip_extents should be the result of
+        _sorted_extents(clip_box).
+        """
         self._renderer = renderer
         self._clip_box = clip_box
+        self._clip_extents = clip_extents
+
+    def __getattr__(self, item: str) -> Any:
+        # Only called when normal lookup fails, so everything not defined
+        # on the wrapper is read from the wrapped artist.
+        return getattr(self._artist, item)
+
+    def get_window_extent(self, renderer: RendererBase = None) -> Bbox:
+        return self._get_window_extent(renderer)
 
-    def __getattribute__(self, item: str) -> Any:
-        try:
-            return super().__getattribute__(item)
-        except AttributeError:
-            return self._artist.__getattribute__(item)
+    def get_clip_box(self) -> Optional[Bbox]:
+        return self._get_clip_box()
 
-    def __setattr__(self, key: str, value: Any):
-        try:
-            super().__setattr__(key, value)
-        except AttributeError:
-            self._artist.__setattr__(key, value)
+    def set_clip_box(self, clipbox: Optional[Bbox]):
+        self._set_clip_box(clipbox)
 
     def draw(self, renderer: RendererBase):
-        # Disable the artist defined clip box, as the artist might be visible
-        # under the new renderer even if not on screen...
-        clip_box_orig = self._artist.get_clip_box()
-        clip_path_orig = self._artist.get_clip_path()
+        artist = self._artist
+        # Invisible artists draw nothing, so don't bother computing extents
+        # or touching their clip settings...
+        if(not artist.get_visible()):
+            return
+
+        full_extents = self._get_window_extent(self._renderer)
 
-        full_extents = self._artist.get_window_extent(self._renderer)
-        self._artist.set_clip_box(None)
-        self._artist.set_clip_path(None)
+        # Disable the artist defined clip box, as the artist might be visible
+        # under the new renderer even if not on screen. If clipping is off
+        # the clip box and path are ignored anyways, so leave them alone.
+        # Each setter marks the artist stale and fires callbacks, so only
+        # call them for a clip box or path that is actually set...
+        clip_box_orig = clip_path_orig = None
+        if(artist.get_clip_on()):
+            clip_box_orig = self._get_clip_box()
+            clip_path_orig = self._get_clip_path()
+            if(clip_box_orig is not None):
+                self._set_clip_box(None)
+            if(clip_path_orig is not None):
+                self._set_clip_path(None)
 
         # If we are working with a 3D object, swap out it's axes with
         # this zoom axes (swapping out the 3d transform) and reproject it.
-        if(hasattr(self._artist, "do_3d_projection")):
+        if(hasattr(artist, "do_3d_projection")):
             self.do_3d_projection()
 
         # Check and see if the passed limiting box and extents of the
         # artist intersect, if not don't bother drawing this artist.
         # First 2 checks are a special case where we received a bad clip box.
         # (those can happen when we try to get the bounds of a map projection)
+        # Done with scalar comparisons, as Bbox.intersection allocates a new
+        # Bbox which we would only compare against None.
+        cx0, cy0, cx1, cy1 = self._clip_extents
+        fx0, fy0, fx1, fy1 = _sorted_extents(full_extents)
         if(
-            self._clip_box.width == 0 or self._clip_box.height == 0 or
-            Bbox.intersection(full_extents, self._clip_box) is not None
+            cx1 - cx0 == 0 or cy1 - cy0 == 0 or (
+                fx0 <= cx1 and cx0 <= fx1 and fy0 <= cy1 and cy0 <= fy1
+            )
         ):
-            self._artist.draw(self._renderer)
+            self._draw(self._renderer)
 
         # Re-enable the clip box... and clip path...
-        self._artist.set_clip_box(clip_box_orig)
-        self._artist.set_clip_path(clip_path_orig)
+        if(clip_box_orig is not None):
+            self._set_clip_box(clip_box_orig)
+        if(clip_path_orig is not None):
+            self._set_clip_path(clip_path_orig)
 
     def do_3d_projection(self) -> float:
         # Get the 3D projection function...
@@ -164,6 +261,14 @@ def view_wrapper(axes_class: Type[Axes]) -> Type[Axes]:
     if(issubclass(axes_class, Axes) and issubclass(axes_class, __ViewType)):
         return axes_class
 
+    # Bind globals used while drawing to closure variables, which are faster
+    # to look up from the View's methods than module globals...
+    chain = itertools.chain
+    bbox_from_extents = Bbox.from_extents
+    sorted_extents = _sorted_extents
+    bound_artist = _BoundRendererArtist
+    transform_renderer = _TransformRenderer
+
     @docstring.interpd
     class View(axes_class, __ViewType):
         """
@@ -211,16 +316,23 @@ def view_wrapper(axes_class: Type[Axes]) -> Type[Axes]:
             # Initialize the view specs dict...
             self.__view_specs = getattr(self, "__view_specs", {})
             self.__renderer = None
+            # Wrapped view artists built for the current renderer, reused if
+            # get_children is called more than once during a single draw.
+            self.__cached_children = None
+            self.__cached_renderer = None
+            # If the wrapped view artists kept between draws can be reused,
+            # only true in the outermost draw of this view...
+            self.__reuse_children = True
+            # Wrapped view artists from the last draw, per viewed axes, stored
+            # alongside the artists and filter set they were built from.
+            self.__child_cache = {}
+            # Scratch buffer for the corners of the view limits, which are
+            # transformed into each viewed axes to get its bounding box.
+            self.__corner_buf = np.empty((3, 2))
             self.__max_render_depth = getattr(
                 self, "__max_render_depth", DEFAULT_RENDER_DEPTH
             )
             self.set_max_render_depth(render_depth)
-            # The current render depth is stored in the figure, so the number
-            # of recursive draws is even in the case of multiple axes drawing
-            # each other in the same figure.
-            self.figure._current_render_depth = getattr(
-                self.figure, "_current_render_depth", 0
-            )
 
         def get_children(self) -> List[Artist]:
             # We overload get_children to return artists from the view axes
@@ -229,53 +341,187 @@ def view_wrapper(axes_class: Type[Axes]) -> Type[Axes]:
             # renderer, and therefore to the correct location.
             child_list = super().get_children()
 
-            def filter_check(artist, filter_set):
-                if(filter_set is None):
-                    return True
-                return (
-                    (artist not in filter_set)
-                    and (type(artist) not in filter_set)
-                )
+            if(self.__renderer is None):
+                return child_list
 
-            if(self.__renderer is not None):
-                for ax, spec in self.view_specifications.items():
-                    mock_renderer = _TransformRenderer(
-                        self.__renderer, ax.transData, self.transData,
-                        self, spec.image_interpolation, spec.scale_lines
-                    )
-
-                    x1, x2 = self.get_xlim()
-                    y1, y2 = self.get_ylim()
-                    axes_box = Bbox.from_extents(x1, y1, x2, y2).transformed(
-                        ax.transData
-                    )
-
-                    child_list.extend([
-                        _BoundRendererArtist(a, mock_renderer, axes_box)
-                        for a in itertools.chain(
-                            ax._children,
-                            ax.child_axes
-                        ) if(filter_check(a, spec.filter_set))
-                    ])
+            if(self.__cached_renderer is not self.__renderer):
+                self.__cached_children = self.__build_view_children(
+                    self.__renderer
+                )
+                self.__cached_renderer = self.__renderer
 
+            child_list.extend(self.__cached_children)
             return child_list
 
+        def __build_view_children(
+            self,
+            renderer: RendererBase
+        ) -> List[_BoundRendererArtist]:
+            view_children = []
+            child_cache = {}
+
+            # Lower left, upper left, and lower right corners of the view
+            # limits, the same points used by Bbox.transformed...
+            x1, x2 = self.get_xlim()
+            y1, y2 = self.get_ylim()
+            corners = self.__corner_buf
+            corners[0] = x1, y1
+            corners[1] = x1, y2
+            corners[2] = x2, y1
+
+            for ax, spec in self.view_specifications.items():
+                # Nothing to draw from this axes, so skip building a renderer
+                # and bounding box for it...
+                if(not any(
+                    a.get_visible()
+                    for a in chain(ax._children, ax.child_axes)
+                )):
+                    continue
+
+                mock_renderer = transform_renderer(
+                    renderer, ax.transData, self.transData,
+                    self, spec.image_interpolation, spec.scale_lines
+                )
+
+                (ll_x, ll_y), (__, ul_y), (lr_x, __) = ax.transData.transform(
+                    corners
+                )
+                axes_box = bbox_from_extents(ll_x, ll_y, lr_x, ul_y)
+
+                # The artists of the viewed axes rarely change between draws,
+                # so if they (and the filter) match the last draw, reuse the
+                # wrappers from then and just point them at the new renderer.
+                filter_set = spec.filter_set
+                cache_key = (
+                    tuple(ax._children),
+                    tuple(ax.child_axes),
+                    None if(filter_set is None) else frozenset(filter_set)
+                )
+                cached = (
+                    self.__child_cache.get(ax, None)
+                    if(self.__reuse_children) else None
+                )
+
+                if(cached is not None and cached[0] == cache_key):
+                    wrappers = cached[1]
+                    clip_extents = sorted_extents(axes_box)
+                    for wrapper in wrappers:
+                        wrapper._retarget(
+                            mock_renderer, axes_box, clip_extents
+                        )
+                else:
+                    # Recycle the wrappers from the last draw where possible,
+                    # instead of allocating a new wrapper for every artist.
+                    wrappers = [] if(cached is None) else cached[1]
+                    pool_size = len(wrappers)
+                    clip_extents = sorted_extents(axes_box)
+                    # Only check artists against the filter if there is one,
+                    # it usually isn't set...
+                    artists = chain(cache_key[0], cache_key[1])
+                    if(filter_set is not None):
+                        artists = [
+                            a for a in artists if(
+                                (a not in filter_set)
+                                and (type(a) not in filter_set)
+                            )
+                        ]
+                    i = 0
+                    for a in artists:
+                        if(i < pool_size):
+                            wrapper = wrappers[i]
+                            wrapper._set_artist(a)
+                            wrapper._retarget(
+                                mock_renderer, axes_box, clip_extents
+                            )
+                        else:
+                            wrappers.append(
+                                bound_artist(a, mock_renderer, axes_box)
+                            )
+                        i += 1
+                    del wrappers[i:]
+
+                child_cache[ax] = (cache_key, wrappers)
+                view_children.extend(wrappers)
+
+            # Nested draws build their own wrappers, and leave the ones kept
+            # between draws alone, as an outer draw may still be using them.
+            if(self.__reuse_children):
+                self.__child_cache = child_cache
+            return view_children
+
+        def invalidate_view_cache(self):
+            """
+            Clear the wrapped artists this view keeps between draws, forcing
+            them to be rebuilt on the next draw. Changes to the artists of the
+            viewed axes are detected automatically, so this is only needed
+            if the cache should be dropped early (for example, to release
+            references to removed artists).
+            """
+            self.__child_cache = {}
+            self.__cached_children = None
+            self.__cached_renderer = None
+
         def draw(self, renderer: RendererBase = None):
             # It is possible to have two axes which are views of each other
             # therefore we track the number of recursions and stop drawing
             # at a certain depth
-            if(self.figure._current_render_depth >= self.__max_render_depth):
+            depths = _DRAW_STATE.depths
+            key = id(self.figure)
+            depth = depths.get(key, 0)
+            if(depth):
+                self.__draw_nested(renderer, depths, key, depth)
                 return
-            self.figure._current_render_depth += 1
+
+            # Common case, not within another view draw...
+            depths[key] = 1
             # Set the renderer, causing get_children to return the view's
             # children also...
             self.__renderer = renderer
-
-            super().draw(renderer)
-
-            # Get rid of the renderer...
-            self.__renderer = None
-            self.figure._current_render_depth -= 1
+            self.__cached_children = None
+            self.__cached_renderer = None
+
+            try:
+                super().draw(renderer)
+            finally:
+                # Get rid of the renderer, and the children built for it...
+                self.__renderer = None
+                self.__cached_children = None
+                self.__cached_renderer = None
+                del depths[key]
+
+        def __draw_nested(
+            self,
+            renderer: RendererBase,
+            depths: Dict[int, int],
+            key: int,
+            depth: int
+        ):
+            if(depth >= self.__max_render_depth):
+                return
+            depths[key] = depth + 1
+            # If this view is being drawn within its own draw, save the outer
+            # draw's state so it can be restored afterwards...
+            outer_state = (
+                self.__renderer,
+                self.__cached_children,
+                self.__cached_renderer,
+                self.__reuse_children
+            )
+            self.__renderer = renderer
+            self.__cached_children = None
+            self.__cached_renderer = None
+            self.__reuse_children = outer_state[0] is None
+
+            try:
+                super().draw(renderer)
+            finally:
+                (
+                    self.__renderer,
+                    self.__cached_children,
+                    self.__cached_renderer,
+                    self.__reuse_children
+                ) = outer_state
+                depths[key] = depth
 
         def __reduce__(self):
             builder, args = super().__reduce__()[:2]
@@ -295,6 +541,8 @@ def view_wrapper(axes_class: Type[Axes]) -> Type[Axes]:
         def __getstate__(self):
             state = super().__getstate__()
             state["__renderer"] = None
+            # Cached wrappers hold renderers, which can't be pickled...
+            state["_View__child_cache"] = {}
             return state
 
         def get_max_render_depth(self) -> int:
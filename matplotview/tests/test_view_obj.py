@@ -18,6 +18,22 @@ def test_obj_comparison():
     assert view_class2 != view_class3
 
 
+@plotting_test()
+def test_view_class_reuse(fig_test):
+    ax_test1, ax_test2, ax_test3 = fig_test.subplots(1, 3)
+    ax_test1.plot([i for i in range(10)])
+
+    view_class = type(view(ax_test2, ax_test1))
+
+    # Every view of the same axes type should share a single class, and
+    # wrapping a view class again should give back that same class...
+    assert type(view(ax_test3, ax_test1)) is view_class
+    assert view_wrapper(type(ax_test1)) is view_class
+    assert view_wrapper(view_class) is view_class
+    assert view_class.from_axes(ax_test2) is ax_test2
+    assert type(ax_test2) is view_class
+
+
 @check_figures_equal(tol=5.6)
 def test_getters_and_setters(fig_test, fig_ref):
     np.random.seed(1)
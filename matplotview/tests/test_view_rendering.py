@@ -219,3 +219,51 @@ def test_double_view(fig_test, fig_ref):
         ax.set_aspect(1)
         ax.relim()
         ax.autoscale_view()
+
+
+@check_figures_equal(tol=3.5)
+def test_hidden_and_unclipped_artists(fig_test, fig_ref):
+    # Test Case...
+    ax_test1, ax_test2 = fig_test.subplots(1, 2)
+    ax_test1.plot([i for i in range(10)], "r")
+    ax_test1.plot([i for i in range(10, 0, -1)], "b").pop().set_visible(False)
+    ax_test1.plot([0, 9], [5, 5], "g", clip_on=False)
+    ax_test1.add_patch(plt.Circle((3, 3), 1, fc="blue", visible=False))
+    ax_test2 = view(ax_test2, ax_test1)
+    ax_test2.set_xlim(ax_test1.get_xlim())
+    ax_test2.set_ylim(ax_test1.get_ylim())
+
+    # Reference...
+    ax_ref1, ax_ref2 = fig_ref.subplots(1, 2)
+    for ax in (ax_ref1, ax_ref2):
+        ax.plot([i for i in range(10)], "r")
+        ax.plot([i for i in range(10, 0, -1)], "b").pop().set_visible(False)
+        ax.plot([0, 9], [5, 5], "g", clip_on=False)
+        ax.add_patch(plt.Circle((3, 3), 1, fc="blue", visible=False))
+    ax_ref2.set_xlim(ax_ref1.get_xlim())
+    ax_ref2.set_ylim(ax_ref1.get_ylim())
+
+
+@check_figures_equal(tol=3.5)
+def test_view_updates_between_draws(fig_test, fig_ref):
+    # Test Case...
+    ax_test1, ax_test2 = fig_test.subplots(1, 2)
+    line = ax_test1.plot([i for i in range(10)], "r")[0]
+    circle = ax_test1.add_patch(plt.Circle((3, 3), 1, fc="blue"))
+    ax_test2 = view(ax_test2, ax_test1, filter_set=[circle])
+    for ax in (ax_test1, ax_test2):
+        ax.set_xlim(0, 10)
+        ax.set_ylim(0, 10)
+    fig_test.canvas.draw()
+    # Change the viewed axes and filter, the view should pick this up...
+    line.remove()
+    ax_test1.plot([i for i in range(10, 0, -1)], "b")
+    ax_test2.view_specifications[ax_test1].filter_set.clear()
+
+    # Reference...
+    ax_ref1, ax_ref2 = fig_ref.subplots(1, 2)
+    for ax in (ax_ref1, ax_ref2):
+        ax.plot([i for i in range(10, 0, -1)], "b")
+        ax.add_patch(plt.Circle((3, 3), 1, fc="blue"))
+        ax.set_xlim(0, 10)
+        ax.set_ylim(0, 10)